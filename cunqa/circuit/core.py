@@ -4,14 +4,18 @@ from __future__ import annotations
 
 import numpy as np
 import copy
+import sys
 from typing import Union, Optional
-from sympy.core.sympify import sympify, SympifyError
 
 from cunqa.utils import generate_id
 from cunqa.circuit.parameter import Param
+from cunqa.circuit.helpers import copy_instruction
 
 from cunqa.logger import logger
 
+# Remote instructions that cannot be placed inside a classically or remotely controlled block
+_FORBIDDEN_IN_BLOCK = frozenset({"qsend", "qrecv", "expose", "recv"})
+
 class CunqaCircuit:
     """
     Quantum circuit abstraction for the CUNQA API. 
@@ -123,6 +127,9 @@ class CunqaCircuit:
     .. autoattribute:: classical_regs
     .. autoattribute:: sending_to
 
+    Instances only hold the attributes listed in ``__slots__``, so arbitrary attributes cannot be
+    set on a circuit; they can still be weakly referenced.
+
     Operations
     ==========
 
@@ -314,6 +321,12 @@ class CunqaCircuit:
     classical_regs: dict #: Dictionary of classical registers of the circuit as ``{"name": [assigned clbits]}``.
     sending_to: set[str] #: Set of circuit ids to which the current circuit is sending measurement outcomes or qubits. 
     params: list[Param] #: Ordered list of the parameters names that the circuit currently has.
+    blocks_with_comms: list[str] #: Ids of the joined circuits that had communications, if any.
+
+    __slots__ = (
+        "_id", "is_dynamic", "has_cc", "has_qc", "instructions", "params", "quantum_regs", 
+        "classical_regs", "sending_to", "blocks_with_comms", "__weakref__"
+    )
     
     def __init__(
             self, 
@@ -345,6 +358,10 @@ class CunqaCircuit:
         else:
             self._id = id
 
+        # Ids are compared and hashed whenever communications are resolved (union, QPU.run), 
+        # interning them makes equal ids share the same object
+        self._id = sys.intern(self._id)
+
     @property
     def id(self) -> str:
         """Returns circuit id."""
@@ -375,14 +392,14 @@ class CunqaCircuit:
         """
         Number of qubits of the circuit.
         """
-        return sum([len(qr) for qr in self.quantum_regs.values()])
+        return sum(len(qr) for qr in self.quantum_regs.values())
     
     @property
     def num_clbits(self) -> int:
         """
         Number of classical bits of the circuit.
         """
-        return sum([len(qr) for qr in self.classical_regs.values()])
+        return sum(len(qr) for qr in self.classical_regs.values())
 
     def add_instructions(self, instructions: Union[dict, list[dict]]):
         """
@@ -392,22 +409,29 @@ class CunqaCircuit:
             instructions (dict | list[dist]): instruction(s) to be added.
         """
         def handle_params(instruction):
-            if "params" in instruction and len(instruction["params"]) != 0:
-                if any([isinstance(p, Param) for p in instruction["params"]]):
-                    for p in instruction["params"]:
-                        new_params = []
+            params = instruction.get("params")
+            if params:
+                if any(isinstance(p, Param) for p in params):
+                    new_params = []
+                    for p in params:
                         if isinstance(p, Param):
                             # Copy needed for circuit transformations to avoid aliasing
-                            new_param = copy.deepcopy(p);  new_params.append(new_param)
-                            self.params.append(new_param)
+                            p = copy.deepcopy(p)
+                            self.params.append(p)
+                        new_params.append(p)
 
-                    new_instr = copy.deepcopy(instruction)
+                    new_instr = copy_instruction(instruction)
                     new_instr["params"] = new_params
 
                     return new_instr
 
+                # Real numbers are kept as they are, no need to build symbolic expressions
+                if all(isinstance(p, (int, float)) for p in params):
+                    return instruction
                 
-                # Converting the string to a symbolic expression
+                # Converting the string to a symbolic expression. SymPy is imported here as it is 
+                # only needed for symbolic parameters and it is slow to import
+                from sympy.core.sympify import sympify, SympifyError
                 try:
                     exprs = sympify(instruction["params"])
                 except SympifyError:
@@ -429,12 +453,9 @@ class CunqaCircuit:
             return instruction
 
         if isinstance(instructions, dict):
-            new_instr = handle_params(instructions)
-            self.instructions.append(new_instr)
+            self.instructions.append(handle_params(instructions))
         else:
-            for instr in instructions:
-                new_instr = handle_params(instr)
-                self.instructions.append(new_instr)
+            self.instructions.extend([handle_params(instr) for instr in instructions])
                     
     def add_q_register(self, name: str, num_qubits: int):
         """
@@ -457,7 +478,8 @@ class CunqaCircuit:
             new_name = f"{name}_{i}"
             logger.warning(f"{name} for quantum register in use, renaming to {new_name}.")
 
-        self.quantum_regs[new_name] = [(self.num_qubits + i) for i in range(num_qubits)]
+        first_qubit = self.num_qubits
+        self.quantum_regs[new_name] = list(range(first_qubit, first_qubit + num_qubits))
         return new_name
 
     def add_cl_register(self, name: str, num_clbits: int):
@@ -480,7 +502,8 @@ class CunqaCircuit:
             new_name = f"{name}_{i}"
             logger.warning(f"{name} for classical register in use, renaming to {new_name}.")
         
-        self.classical_regs[new_name] = [(self.num_clbits + i) for i in range(num_clbits)]
+        first_clbit = self.num_clbits
+        self.classical_regs[new_name] = list(range(first_clbit, first_clbit + num_clbits))
         return new_name
     
     # =============== INSTRUCTIONS ===============
@@ -664,14 +687,18 @@ class CunqaCircuit:
         Class to apply a global measurement of all of the qubits of the circuit. An additional 
         classcial register will be added and labeled as "measure".
         """
-        new_clreg = self.add_cl_register("measure", self.num_qubits)
+        num_qubits = self.num_qubits
+        new_clreg = self.add_cl_register("measure", num_qubits)
+        new_clbits = self.classical_regs[new_clreg]
 
-        for q in range(self.num_qubits):
-            self.add_instructions({
+        self.add_instructions([
+            {
                 "name":"measure",
                 "qubits":[q],
-                "clbits":[self.classical_regs[new_clreg][q]],
-            })
+                "clbits":[new_clbits[q]],
+            }
+            for q in range(num_qubits)
+        ])
     
     def measure(self, qubits: Union[int, list[int]], clbits: Union[int, list[int]]) -> None:
         """
@@ -2126,7 +2153,7 @@ class CunqaCircuit:
 
         elif (isinstance(matrix, list) and 
               isinstance(matrix[0], list) and 
-              all([len(matrix) == len(m) for m in matrix]) and 
+              all(len(matrix) == len(m) for m in matrix) and 
               (len(matrix)%2 == 0)):
             
             matrix = matrix
@@ -2161,7 +2188,7 @@ class CunqaCircuit:
 
         elif (isinstance(matrix, list) and 
               isinstance(matrix[0], list) and 
-              all([len(matrix) == len(m) for m in matrix]) and 
+              all(len(matrix) == len(m) for m in matrix) and 
               (len(matrix)%2 == 0)):
             
             matrix = matrix
@@ -2200,7 +2227,7 @@ class CunqaCircuit:
 
         elif (isinstance(matrix, list) and 
               isinstance(matrix[0], list) and 
-              all([len(matrix) == len(m) for m in matrix]) and 
+              all(len(matrix) == len(m) for m in matrix) and 
               (len(matrix)%2 == 0)):
             
             matrix = matrix
@@ -2608,7 +2635,7 @@ class ClassicalControlContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         instructions = []
         for instr in self._subcircuit.instructions:
-            if instr["name"] in ["qsend", "qrecv", "expose", "recv"]:
+            if instr["name"] in _FORBIDDEN_IN_BLOCK:
                 raise RuntimeError("Remote operations, quantum or classical, are not allowed within "
                                    "a telegate block.")
             instructions.append(instr)
@@ -2642,7 +2669,7 @@ class QuantumControlContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         instructions = []
         for instruction in self._subcircuit.instructions:
-            if instruction["name"] in ["qsend", "qrecv", "expose", "recv"]:
+            if instruction["name"] in _FORBIDDEN_IN_BLOCK:
                 raise RuntimeError("Remote operations, quantum or classical, are not allowed "
                                    "within a telegate block.")
             instructions.append(instruction)
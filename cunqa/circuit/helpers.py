@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+
+def copy_instruction(instruction: dict) -> dict:
+    """
+    Copies an instruction dict of the IR.
+
+    Lists (``qubits``, ``clbits``, ``params``, ...), including nested ones such as the rows of a
+    unitary matrix, are copied and nested ``instructions`` of classically or remotely controlled
+    blocks are copied recursively, so the result can be modified freely. Objects held inside the
+    lists (e.g. :py:class:`~cunqa.circuit.parameter.Param`) are shared, which makes this much
+    cheaper than :py:func:`copy.deepcopy`.
+
+    Args:
+        instruction (dict): instruction to copy.
+
+    Return:
+        A copy of the instruction.
+    """
+    new_instruction = {}
+    for key, value in instruction.items():
+        if key == "instructions":
+            new_instruction[key] = [copy_instruction(sub_instr) for sub_instr in value]
+        elif type(value) is list:
+            new_instruction[key] = _copy_list(value)
+        else:
+            new_instruction[key] = value
+    return new_instruction
+
+
+def _copy_list(value: list) -> list:
+    return [_copy_list(item) if type(item) is list else item for item in value]
@@ -14,6 +14,9 @@ SUPPORTED_QISKIT_OPERATIONS = {
     'swap', 'cy', 'cry', 'cz','h', 'cu3', 'measure', 'if_else', 'barrier', 'reset', 'save_state', 'set_statevector'
 }
 
+# Supported operations that are not plain (possibly parametric) gates and need a specific conversion
+NON_GATE_QISKIT_OPERATIONS = {'measure', 'unitary', 'save_state', 'set_statevector', 'if_else', 'barrier'}
+
 @singledispatch
 def to_ir(circuit: object) -> dict:
     meth = getattr(circuit, "to_ir", None)
@@ -51,15 +54,21 @@ if CUNQA_USE_QISKIT_PY:
             Json dict with the circuit information.
         """
         quantum_registers = {}
+        qubit_indices = {}
         qinit = 0
         for qr in c.qregs:
             quantum_registers[qr.name] = list(range(qinit, qinit + qr.size))
+            for i, qubit in enumerate(qr):
+                qubit_indices.setdefault(qubit, qinit + i)
             qinit += qr.size
 
         classical_registers = {}
+        clbit_indices = {}
         cinit = 0
         for cr in c.cregs:
             classical_registers[cr.name] = list(range(cinit, cinit + cr.size))
+            for i, clbit in enumerate(cr):
+                clbit_indices.setdefault(clbit, cinit + i)
             cinit += cr.size
         
         json_data = {
@@ -67,68 +76,121 @@ if CUNQA_USE_QISKIT_PY:
             "is_dynamic": False,
             "instructions":[],
             "sending_to":[],
-            "num_qubits":sum([q.size for q in c.qregs]),
-            "num_clbits": sum([c.size for c in c.cregs]),
+            "num_qubits": qinit,
+            "num_clbits": cinit,
             "quantum_registers": quantum_registers,
             "classical_registers": classical_registers, 
             "params":[],
             "component_comms": {}
         }
 
-        for instruction in c.data:
-            if instruction.operation.name not in SUPPORTED_QISKIT_OPERATIONS:
-                raise ValueError(f"Instruction {instruction.operation.name} not supported for conversion.")
+        json_data["is_dynamic"] = _data_to_ir(
+            c.data, qubit_indices, clbit_indices, qinit, json_data["instructions"]
+        )
+
+        return json_data
+
+    def _data_to_ir(data, qubit_indices: dict, clbit_indices: dict, num_qubits: int, 
+                    instructions: list) -> bool:
+        """
+        Transforms the instructions of a `qiskit.QuantumCircuit` to json and appends them to 
+        `instructions`.
+
+        Args:
+            data (list[qiskit.circuit.CircuitInstruction]): instructions to transform.
+            qubit_indices (dict): index in the json circuit of each qubit used in `data`.
+            clbit_indices (dict): index in the json circuit of each clbit used in `data`.
+            num_qubits (int): number of qubits of the json circuit.
+            instructions (list): list where the transformed instructions are appended.
+
+        Return:
+            True if any of the instructions is classically controlled, False otherwise.
+        """
+        is_dynamic = False
+
+        for instruction in data:
+            operation = instruction.operation
+            name = operation.name
 
-            qreg = [r._register.name for r in instruction.qubits]
-            qubit = [q._index for q in instruction.qubits]
+            if name not in SUPPORTED_QISKIT_OPERATIONS:
+                raise ValueError(f"Instruction {name} not supported for conversion.")
+
+            qubits = [qubit_indices[q] for q in instruction.qubits]
+            clbits = [clbit_indices[b] for b in instruction.clbits]
+
+            if name not in NON_GATE_QISKIT_OPERATIONS:
+                # Most common case, checked first to skip the comparisons below
+                instruction_params = [
+                    str(param) if isinstance(param, Parameter) else param 
+                    for param in operation.params
+                ]
             
-            clreg = [r._register.name for r in instruction.clbits]
-            bit = [b._index for b in instruction.clbits]
+                instr = {"name":name, 
+                        "qubits":qubits,
+                        "params":instruction_params
+                        }
+                
+                if operation.condition != None:
+
+                    if operation._condition[1] not in [1]:
+                        raise ValueError("Only 1 is accepted as condition for classicaly controlled "
+                                        "operations for the current version.")
+                        
+                    cc_clbit = clbit_indices[operation.condition[0]]
+
+                    is_dynamic = True
+                    instructions.append({"name":"cif",
+                                        "clbits":[cc_clbit],
+                                        "instructions":[instr]
+                                        })
+                
+                else:
+                    instructions.append(instr)
 
-            if instruction.operation.name == "barrier":
+            elif name == "barrier":
                 pass
 
-            elif instruction.operation.name == "measure":
-                json_data["instructions"].append({
-                    "name":instruction.operation.name,
-                    "qubits":[quantum_registers[k][q] for k,q in zip(qreg, qubit)],
-                    "clbits":[classical_registers[k][b] for k,b in zip(clreg, bit)]
+            elif name == "measure":
+                instructions.append({
+                    "name":name,
+                    "qubits":qubits,
+                    "clbits":clbits
                 })
 
-            elif instruction.operation.name == "unitary":
-                json_data["instructions"].append({
-                    "name":instruction.operation.name, 
-                    "qubits":[quantum_registers[k][q] for k,q in zip(qreg, qubit)],
+            elif name == "unitary":
+                instructions.append({
+                    "name":name, 
+                    "qubits":qubits,
                     "params":[[list(map(lambda z: [z.real, z.imag], row)) 
-                            for row in instruction.operation.params[0].tolist()]]
+                            for row in operation.params[0].tolist()]]
                 })
 
-            elif instruction.operation.name == "save_state":
-                json_data["instructions"].append({
-                    "name":instruction.operation.name, 
-                    "qubits":[quantum_registers[k][q] for k,q in zip(qreg, qubit)],
-                    "snapshot_type": instruction.operation._subtype,
-                    "label": instruction.operation.label
+            elif name == "save_state":
+                instructions.append({
+                    "name":name, 
+                    "qubits":qubits,
+                    "snapshot_type": operation._subtype,
+                    "label": operation.label
                 })
-            elif instruction.operation.name == "set_statevector":
-                json_data["instructions"].append({
-                "name":instruction.operation.name,
-                "qubits":list(range(sum([q.size for q in c.qregs]))),
+            elif name == "set_statevector":
+                instructions.append({
+                "name":name,
+                "qubits":list(range(num_qubits)),
                 "params": [
                     list(map(lambda z: [z.real, z.imag],
-                    instruction.operation.params[0].tolist()))
+                    operation.params[0].tolist()))
                     ]
                 })
 
-            elif instruction.operation.name == "if_else":
-                json_data["is_dynamic"] = True
+            elif name == "if_else":
+                is_dynamic = True
 
-                if not any([sub_circuit is None for sub_circuit in instruction.operation.params]):
+                if not any(sub_circuit is None for sub_circuit in operation.params):
                     raise ValueError("if_else instruction with \'else\' case is not supported for the "
                                     "current version.")
                 else:
                     sub_circuit = [
-                        sub_circuit for sub_circuit in instruction.operation.params 
+                        sub_circuit for sub_circuit in operation.params 
                         if sub_circuit is not None
                     ][0]
 
@@ -137,49 +199,21 @@ if CUNQA_USE_QISKIT_PY:
                     raise ValueError("Only 0 or 1 are accepted as conditions for classically controlled "
                                     "operations for the current version.")
                 
-                for re in c.qregs:
-                    sub_circuit.add_register(re)
+                # The bits of the body are those of the if_else instruction, in the same order
+                sub_qubit_indices = dict(zip(sub_circuit.qubits, qubits))
+                sub_clbit_indices = dict(zip(sub_circuit.clbits, clbits))
 
-                sub_instructions = to_ir(sub_circuit)["instructions"]
+                sub_instructions = []
+                _data_to_ir(sub_circuit.data, sub_qubit_indices, sub_clbit_indices, num_qubits, 
+                            sub_instructions)
 
                 cc_instruction = {
                     "name": "cif",
-                    "clbits": [classical_registers[k][b] for k,b in zip(clreg, bit)],
+                    "clbits": clbits,
                     "instructions": sub_instructions,
                     "condition": condition
                     }
                 
-                json_data["instructions"].append(cc_instruction)
-
-            else:
-
-                instruction_params = [
-                    str(param) if (isinstance(param, Parameter) or isinstance(param, Parameter)) else param 
-                    for param in instruction.operation.params
-                ]
-            
-                instr = {"name":instruction.operation.name, 
-                        "qubits":[quantum_registers[k][q] for k,q in zip(qreg, qubit)],
-                        "params":instruction_params
-                        }
-                
-                if instruction.operation.condition != None:
-
-                    if instruction.operation._condition[1] not in [1]:
-                        raise ValueError("Only 1 is accepted as condition for classicaly controlled "
-                                        "operations for the current version.")
-                        
-                    name = instruction.operation.condition[0]._register.name
-                    index = instruction.operation.condition[0]._index
-                    cc_clbit = classical_registers[name][index]
-
-                    json_data["is_dynamic"] = True
-                    json_data["instructions"].append({"name":"cif",
-                                                "clbits":[cc_clbit],
-                                                "instructions":[instr]
-                                                })
-                
-                else:
-                    json_data["instructions"].append(instr)
+                instructions.append(cc_instruction)
 
-        return json_data
\ No newline at end of file
+        return is_dynamic
@@ -1,5 +1,8 @@
-from sympy import Symbol
-from typing import Any
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sympy import Symbol
 
 class Param:
     """
@@ -1,10 +1,10 @@
 from typing import Union
-import copy
-import numpy as np
 from itertools import accumulate
+from bisect import bisect_right
 
 from cunqa.logger import logger
 from cunqa.circuit.core import CunqaCircuit
+from cunqa.circuit.helpers import copy_instruction
 from cunqa.constants import REMOTE_GATES
 
 def vsplit():
@@ -36,11 +36,11 @@ def hsplit(circuit: CunqaCircuit, qubits_or_sections: Union[list[int], int]) ->
 
     if isinstance(qubits_or_sections, list):
         # handle list case.
-        if np.sum(qubits_or_sections) != num_qubits:
+        if sum(qubits_or_sections) != num_qubits:
             raise RuntimeError(f"Error: Incorrect hsplit of the circuit, {qubits_or_sections} does "
                                f"not add up to {num_qubits} qubits")
         Nsections = len(qubits_or_sections)
-        initial_qubits = [0] + [int(x) for x in np.cumsum(qubits_or_sections)]
+        initial_qubits = list(accumulate(qubits_or_sections, initial=0))
 
     elif isinstance(qubits_or_sections, int):
         # indices_or_sections is a scalar, not a list.
@@ -50,74 +50,71 @@ def hsplit(circuit: CunqaCircuit, qubits_or_sections: Union[list[int], int]) ->
         Neach_section, extras = divmod(num_qubits, Nsections)
         section_sizes = (extras * [Neach_section + 1] +
                          (Nsections - extras) * [Neach_section])
-        initial_qubits = [0] + [int(x) for x in np.cumsum(section_sizes)]
+        initial_qubits = list(accumulate(section_sizes, initial=0))
 
     def get_subcircuits(circuit, initial_qubits, Nsections):
         sub_circuits = []
-        measures = {}
-        clbits = {}
+        measures = [[] for _ in range(Nsections)]
+        clbits = [set() for _ in range(Nsections)]
         
         for i in range(Nsections):
             num_qubits_i = initial_qubits[i + 1] - initial_qubits[i]
             sub_circuits.append(CunqaCircuit(num_qubits_i, id= circuit.info["id"] + f"_{i}"))
 
         def find_index(array, value):
-            for i, elem in enumerate(array):
-                if(elem > value):
-                    return i - 1
-
-        for inst in circuit.instructions[:]:
-            i = find_index(initial_qubits, inst["qubits"][0])
+            # Index of the section whose initial qubit is the last one not greater than value
+            return bisect_right(array, value) - 1
+
+        for inst in circuit.instructions:
+            # Instructions are renumbered in place, so copy them instead of the whole circuit
+            inst = copy_instruction(inst)
+            qubits = inst["qubits"]
+            i = find_index(initial_qubits, qubits[0])
             sub_circuit = sub_circuits[i]
-            clbits[i] = []
-            measures[i] = []
             
             if inst["name"] == "measure":
                 # Measure and clbits processing
-                for b in inst["clbits"]:
-                    from bisect import bisect_left
-
-                    b = int(b)
-                    pos = bisect_left(clbits[i], b)
-                    if pos == len(clbits[i]) or clbits[i][pos] != b:
-                        clbits[i].insert(pos, b)
-                    measures[i] = measures[i] + [inst]
-                inst["qubits"][0] -= initial_qubits[i]
+                clbits[i].update(inst["clbits"])
+                measures[i].append(inst)
+                qubits[0] -= initial_qubits[i]
                 sub_circuit.add_instructions([inst])
-            elif len(inst["qubits"]) == 1:
+            elif len(qubits) == 1:
                 # One qubit gate
-                inst["qubits"][0] -= initial_qubits[i]
+                qubits[0] -= initial_qubits[i]
                 sub_circuit.add_instructions([inst])
-            elif len(inst["qubits"]) == 2:
+            elif len(qubits) == 2:
                 # Two qubits gate
-                j = find_index(initial_qubits, inst["qubits"][1])
+                j = find_index(initial_qubits, qubits[1])
                 if i != j:
                     # Have to divide the gate
                     target_circuit = sub_circuits[j]
 
-                    ctrl_qubit = inst["qubits"][0] - initial_qubits[i]
-                    target_qubit = inst["qubits"][1] - initial_qubits[j]
+                    ctrl_qubit = qubits[0] - initial_qubits[i]
+                    target_qubit = qubits[1] - initial_qubits[j]
 
                     with sub_circuit.expose(ctrl_qubit, target_circuit) as ([rqubit], subcircuit):
-                        inst["qubits"][0] = rqubit
-                        inst["qubits"][1] = target_qubit
+                        qubits[0] = rqubit
+                        qubits[1] = target_qubit
                         subcircuit.add_instructions([inst])
                 else:
-                    inst["qubits"][0] -= initial_qubits[i]
-                    inst["qubits"][1] -= initial_qubits[i]
+                    qubits[0] -= initial_qubits[i]
+                    qubits[1] -= initial_qubits[i]
                     sub_circuit.add_instructions([inst])
             else:
                 raise ValueError("Three qubits gates cannot be partitioned.")
         
-        if len(clbits):
-            for i, sub_circuit in enumerate(sub_circuits):
-                sub_circuit.add_cl_register(f"subcl_0", len(clbits[i]))
-                for j, measure_i, in enumerate(measures[i]):
-                    measure_i["clbits"] = [clbits[i].index(clbit) for clbit in measure_i["clbits"]]
+        for i, sub_circuit in enumerate(sub_circuits):
+            if not clbits[i]:
+                continue
+            # Clbits measured in each subcircuit are compacted to 0..n-1 keeping their order
+            new_clbits = {clbit: k for k, clbit in enumerate(sorted(clbits[i]))}
+            sub_circuit.add_cl_register(f"subcl_0", len(new_clbits))
+            for measure_i in measures[i]:
+                measure_i["clbits"] = [new_clbits[clbit] for clbit in measure_i["clbits"]]
         
         return sub_circuits 
     
-    return get_subcircuits(copy.deepcopy(circuit), initial_qubits, Nsections)
+    return get_subcircuits(circuit, initial_qubits, Nsections)
 
 def union(circuits: list[CunqaCircuit]) -> CunqaCircuit:
     """
@@ -147,28 +144,30 @@ def union(circuits: list[CunqaCircuit]) -> CunqaCircuit:
         logger.warning("Not enough circuits to perform a union, returning the original circuit.")
         return circuits[0]
 
-    circuits = copy.deepcopy(circuits) # avoid aliasing
-
-    qubit_offsets = [0] + list(accumulate(c.num_qubits for c in circuits[:-1]))
-    clbit_offsets = [0] + list(accumulate(c.num_clbits for c in circuits[:-1]))
+    # No copy of the circuits is needed: reindex copies each instruction before displacing it
+    # Offsets of each circuit in the union, the last elements being the total number of bits
+    qubit_offsets = list(accumulate((c.num_qubits for c in circuits), initial=0))
+    clbit_offsets = list(accumulate((c.num_clbits for c in circuits), initial=0))
     circuit_ids = {c.id for c in circuits}
 
     def reindex(instr: dict, idx: int, exposed_q: int = -1) -> dict:
-        new_instr = dict(instr)
-        if "instructions" in new_instr:
-            sub_instructions = []
-            for sub_instr in new_instr["instructions"]:
-                sub_instructions.append(reindex(sub_instr, idx, exposed_q))
-            new_instr = sub_instructions
-        if "qubits" in new_instr:
-            if exposed_q == -1:
-                new_instr["qubits"] = [q + qubit_offsets[idx] for q in new_instr["qubits"]]
-            else:
-                new_instr["qubits"] = [q + qubit_offsets[idx] if q != -1 else exposed_q 
-                                       for q in new_instr["qubits"]]
-        if "clbits" in new_instr:
-            new_instr["clbits"] = [c + clbit_offsets[idx] for c in new_instr["clbits"]]
-        return new_instr
+        # Copy first, so that the union never shares containers with the original circuits
+        return displace(copy_instruction(instr), qubit_offsets[idx], clbit_offsets[idx], exposed_q)
+
+    def displace(instr: dict, qubit_offset: int, clbit_offset: int, exposed_q: int) -> dict:
+        if "instructions" in instr:
+            for sub_instr in instr["instructions"]:
+                displace(sub_instr, qubit_offset, clbit_offset, exposed_q)
+        # instr is already a private copy, so its lists are updated in place
+        if "qubits" in instr:
+            qubits = instr["qubits"]
+            for k, q in enumerate(qubits):
+                qubits[k] = q + qubit_offset if q != -1 or exposed_q == -1 else exposed_q
+        if "clbits" in instr:
+            clbits = instr["clbits"]
+            for k, c in enumerate(clbits):
+                clbits[k] = c + clbit_offset
+        return instr
 
     def is_valid_remote(instr: dict) -> bool:
         return (
@@ -177,19 +176,21 @@ def union(circuits: list[CunqaCircuit]) -> CunqaCircuit:
         )
 
     union_circuit = CunqaCircuit(
-        num_qubits=sum(c.num_qubits for c in circuits),
-        num_clbits=sum(c.num_clbits for c in circuits),
+        num_qubits=qubit_offsets[-1],
+        num_clbits=clbit_offsets[-1],
         id="|".join(c.id for c in circuits),
     )
     union_instructions: list[dict] = []
     blocked: dict[str, dict] = {}
 
-    finished = [False if len(circ.instructions) > 0 else True for circ in circuits]
+    instructions = [circ.instructions for circ in circuits]
+    num_instructions = [len(instrs) for instrs in instructions]
+    finished = [n == 0 for n in num_instructions]
     pointers = [0] * len(circuits)
 
     def advance(idx: int) -> None:
         pointers[idx] += 1
-        if pointers[idx] == len(circuits[idx].instructions):
+        if pointers[idx] == num_instructions[idx]:
             finished[idx] = True
 
     def process_remote(instr: dict, idx: int, circuit_id: str) -> bool:
@@ -244,31 +245,42 @@ def union(circuits: list[CunqaCircuit]) -> CunqaCircuit:
                     return False
                 blocked_instr = blocked[target_id]
                 if blocked_instr["name"] == "expose":
-                    for sub_instr in reindex(instr, idx, blocked_instr["qubits"][0]):
-                        union_instructions.append(sub_instr)
+                    union_instructions.extend(
+                        reindex(instr, idx, blocked_instr["qubits"][0])["instructions"]
+                    )
                     del blocked[target_id]
                     return True
 
         return False
 
-    while not all(finished):
-        for idx, circuit in enumerate(circuits):
-            if finished[idx]:
-                continue
-
-            instr = circuit.instructions[pointers[idx]]
-            consumed = False
-
-            if is_valid_remote(instr):
-                consumed = process_remote(instr, idx, circuit.id)
-                union_circuit.is_dynamic = True
-
-            elif circuit.id not in blocked:
-                union_instructions.append(reindex(instr, idx))
-                consumed = True
-
-            if consumed:
-                advance(idx)
+    if not any(instr["name"] in REMOTE_GATES for instrs in instructions for instr in instrs):
+        # No communications at all, so no scheduling is needed: the instructions of the circuits
+        # act on disjoint qubits and clbits and can simply be displaced one circuit after another.
+        # Communications with circuits outside the union still need the round-robin order to
+        # avoid deadlocks with their peers.
+        for idx, instrs in enumerate(instructions):
+            union_instructions.extend(reindex(instr, idx) for instr in instrs)
+    else:
+        append = union_instructions.append
+        ids = [circ.id for circ in circuits]
+        while not all(finished):
+            for idx, circuit_id in enumerate(ids):
+                if finished[idx]:
+                    continue
+
+                instr = instructions[idx][pointers[idx]]
+                consumed = False
+
+                if is_valid_remote(instr):
+                    consumed = process_remote(instr, idx, circuit_id)
+                    union_circuit.is_dynamic = True
+
+                elif circuit_id not in blocked:
+                    append(reindex(instr, idx))
+                    consumed = True
+
+                if consumed:
+                    advance(idx)
 
     # Store which of the circuit blocks have communications for exception in run method
     blocks_with_comms = []
@@ -303,7 +315,6 @@ def add(circuits: list[CunqaCircuit]) -> CunqaCircuit:
         logger.warning("Not enough circuits to perform an addition, returning the original circuit.")
         return circuits[0]
 
-    circuits = copy.deepcopy(circuits)
     circuit_ids = {c.id for c in circuits}
 
     addition_circuit = CunqaCircuit(
@@ -320,7 +331,8 @@ def add(circuits: list[CunqaCircuit]) -> CunqaCircuit:
                 for circ_id in instr["circuits"]:
                     if circ_id in circuit_ids:
                         raise ValueError("Cannot add two circuits that communicate with eachother.")
-            addition_instructions.append(instr)
+            # Copy to avoid aliasing with the original circuits
+            addition_instructions.append(copy_instruction(instr))
 
     # Store which of the circuit blocks have communications for exception in run method
     blocks_with_comms = []
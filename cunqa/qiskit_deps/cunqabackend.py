@@ -68,38 +68,39 @@ class CunqaBackend(BackendV2):
                 error = 1-q["Readout fidelity (RB)"]
             )
         
-        logger.debug(f"{self._num_qubits} qubits properties loaded from noise_properties_json.")
+        logger.debug("%s qubits properties loaded from noise_properties_json.", self._num_qubits)
 
 
         # creating target
         target = Target(num_qubits=self._num_qubits, qubit_properties=qubits_properties)
 
-        logger.debug(f"Target created for {self._num_qubits} qubits.")
+        logger.debug("Target created for %s qubits.", self._num_qubits)
 
 
         # adding readout errors to target
         target.add_instruction(Measure(),readout_errors)
 
-        logger.debug(f"Readout errors added for {len(readout_errors)} qubits.")
+        logger.debug("Readout errors added for %s qubits.", len(readout_errors))
         
 
         # loading single-qubit-gate errors
         single_qubit_gates = {}
 
         for qubit, gates_dict in noise_properties_json["Q1Gates"].items():
-            for gate in gates_dict.keys():
-                try:
-                    single_qubit_gates[gate]=(_get_gate(gate),{})
-                except ValueError:
-                    logger.warning(f"Gate {gate} is not supported by Aer Simulator.")
+            for gate in list(gates_dict):
+                if not _is_supported_gate(gate):
+                    logger.warning("Gate %s is not supported by Aer Simulator.", gate)
                     # because gate will be ignored, we delete it from noise_properties_json
                     gates_dict.pop(gate)
+                elif gate not in single_qubit_gates:
+                    single_qubit_gates[gate]=(_get_gate(gate),{})
 
-        logger.debug(f"{len(single_qubit_gates)} single qubit gates where found: {single_qubit_gates}")
+        logger.debug("%s single qubit gates where found: %s",
+                     len(single_qubit_gates), single_qubit_gates)
 
 
         for qubit,gates_dict in noise_properties_json["Q1Gates"].items():
-            for gate, gate_properties in gates_dict.items():
+            for gate, gate_properties in list(gates_dict.items()):
                 try:
                     single_qubit_gates[gate][1][(_get_qubit_index(qubit),)]  = InstructionProperties(
                         duration = gate_properties["Gate duration (s)"], 
@@ -107,8 +108,8 @@ class CunqaBackend(BackendV2):
                     )
 
                 except ValueError as error:
-                    logger.warning(f"Qubit {qubit} does not have the right sintax "
-                                   f"[{type(error).__name__}].")
+                    logger.warning("Qubit %s does not have the right sintax [%s].",
+                                   qubit, type(error).__name__)
                     logger.warning("Instruction will be ignored.")
                     # because gate will be ignored, we delete it from noise_properties_json and 
                     # single_qubit_gates dict
@@ -116,9 +117,9 @@ class CunqaBackend(BackendV2):
                     single_qubit_gates.pop(gate)
 
                 except Exception as error:
-                    logger.error(f"Some error occured while adding instruction for gate {gate} in "
-                                 f"qubit {qubit[2:-1]}: {error} [{type(error).__name__}].")
-                    raise SystemExit # User's level
+                    raise RuntimeError(f"Some error occured while adding instruction for gate "
+                                       f"{gate} in qubit {qubit[2:-1]}: {error} "
+                                       f"[{type(error).__name__}].") from error
 
         
         # adding single qubit gates errors to target
@@ -127,35 +128,37 @@ class CunqaBackend(BackendV2):
                 target.add_instruction(*instruction)
 
             except TranspilerError as error:
-                logger.warning(f"Error adding instructions for gate {gate}: {error.message}.")
+                logger.warning("Error adding instructions for gate %s: %s.", gate, error.message)
                 logger.warning("Instruction will be ignored.")
 
         logger.debug("Added single qubit gates instructions to Target:")
-        #logger.debug(f"{single_qubit_gates}")
+        #logger.debug("%s", single_qubit_gates)
 
         
         # loading two-qubit-gate errors
         two_qubit_gates = {}
 
         for qubits,gates_dict in noise_properties_json["Q2Gates(RB)"].items():
-            for gate in gates_dict.keys():
-                try:
-                    two_qubit_gates[gate]=(_get_gate(gate),{})
-                except ValueError:
-                    logger.warning(f"Gate {gate} is not supported by Aer Simulator.")
+            for gate in list(gates_dict):
+                if not _is_supported_gate(gate):
+                    logger.warning("Gate %s is not supported by Aer Simulator.", gate)
                     # because gate will be ignored, we delete it from noise_properties_json
                     gates_dict.pop(gate)
+                elif gate not in two_qubit_gates:
+                    two_qubit_gates[gate]=(_get_gate(gate),{})
 
-        logger.debug(f"{len(two_qubit_gates)} two qubit gates where found: {two_qubit_gates}")
+        logger.debug("%s two qubit gates where found: %s", len(two_qubit_gates), two_qubit_gates)
 
 
         for qubits,gates_dict in noise_properties_json["Q2Gates(RB)"].items():
-            for gate, gate_properties in gates_dict.items():
+            for gate, gate_properties in list(gates_dict.items()):
                 try:
                     if _get_qubits_indexes(qubits) != [gate_properties["Control"],gate_properties["Target"]]:
-                        logger.warning(f"Inconsistency in control and target qubits for gate "
-                                       f"{gate}({_get_qubits_indexes(qubits)}!={[gate_properties['Control'],gate_properties['Target']]}), "
-                                       f"instruction will be added for qubits {[gate_properties['Control'],gate_properties['Target']]}.")
+                        logger.warning("Inconsistency in control and target qubits for gate "
+                                       "%s(%s!=%s), instruction will be added for qubits %s.",
+                                       gate, _get_qubits_indexes(qubits),
+                                       [gate_properties['Control'],gate_properties['Target']],
+                                       [gate_properties['Control'],gate_properties['Target']])
 
                     two_qubit_gates[gate][1][(gate_properties["Control"],gate_properties["Target"],)] = InstructionProperties(
                         duration = gate_properties["Duration (s)"], 
@@ -163,8 +166,8 @@ class CunqaBackend(BackendV2):
                     )
 
                 except ValueError as error:
-                    logger.warning(f"Qubits {qubits} do not have the right sintax "
-                                   f"[{type(error).__name__}].")
+                    logger.warning("Qubits %s do not have the right sintax [%s].",
+                                   qubits, type(error).__name__)
                     logger.warning("Instruction will be ignored.")
                     # because gate will be ignored, we delete it from noise_properties_json and 
                     # single_qubit_gates dict
@@ -172,9 +175,9 @@ class CunqaBackend(BackendV2):
                     two_qubit_gates.pop(gate)
 
                 except Exception as error:
-                    logger.error(f"Some error occured while adding instruction for gate {gate} in "
-                                 f"qubit {_get_qubits_indexes(qubits)}: {error}.")
-                    raise SystemExit # User's level
+                    raise RuntimeError(f"Some error occured while adding instruction for gate "
+                                       f"{gate} in qubits {qubits}: {error} "
+                                       f"[{type(error).__name__}].") from error
 
 
         # adding two qubit gates error to target
@@ -183,12 +186,12 @@ class CunqaBackend(BackendV2):
                 target.add_instruction(*instruction)
 
             except TranspilerError as error:
-                logger.warning(f"Error adding instructions for gate {gate}: {error.message}.")
+                logger.warning("Error adding instructions for gate %s: %s.", gate, error.message)
                 logger.warning("Instruction will be ignored.")
                 # because gate will be ignored, we delete it from noise_properties_json
         
         logger.debug("Added two qubit gates instructions to Target:")
-        logger.debug(f"{two_qubit_gates}")
+        logger.debug("%s", two_qubit_gates)
 
         self._target = target
 
@@ -305,31 +308,35 @@ from qiskit.circuit.library.standard_gates import (
     SXGate, SXdgGate, TGate, TdgGate, SwapGate, CXGate, CYGate, CZGate, CSXGate, CSwapGate, CCXGate, 
     CCZGate, CPhaseGate, RXXGate, RYYGate, RZZGate, RZXGate)
 
-def _get_gate(name: str):
+_NO_PARAM_GATE_MAP = {
+    "id": IGate, "x": XGate, "y": YGate, "z": ZGate, "h": HGate, "s": SGate, "sdg": SdgGate,
+    "sx": SXGate, "sxdg": SXdgGate, "t": TGate, "tdg": TdgGate, "swap": SwapGate, "cx": CXGate,
+    "cy":  CYGate, "cz": CZGate, "csx": CSXGate, "ccx": CCXGate, "ccz": CCZGate, 
+    "cswap": CSwapGate, "ecr":ECRGate, "reset": Reset
+}
+
+_PARAM_GATE_MAP = {
+    "u1": (U1Gate, 1), "u2": (U2Gate, 2),"u3": (U3Gate, 3), "cu1": (CU1Gate, 1), 
+    "cu3": (CU3Gate, 3), "u": (UGate, 3), "cu": (CUGate, 4), "p": (PhaseGate, 1),
+    "r": (RGate, 2), "rx": (RXGate, 1), "ry": (RYGate, 1), "rz": (RZGate, 1), 
+    "crx": (CRXGate, 1), "cry": (CRYGate, 1), "crz": (CRZGate, 1), "rxx": (RXXGate, 1), 
+    "ryy": (RYYGate, 1),"rzz": (RZZGate, 1),"rzx": (RZXGate, 1), "cp": (CPhaseGate, 1)
+}
+
+def _is_supported_gate(name: str) -> bool:
+    gate_name = name.lower()
+    return gate_name in _NO_PARAM_GATE_MAP or gate_name in _PARAM_GATE_MAP
 
-    no_param_gate_map = {
-        "id": IGate, "x": XGate, "y": YGate, "z": ZGate, "h": HGate, "s": SGate, "sdg": SdgGate,
-        "sx": SXGate, "sxdg": SXdgGate, "t": TGate, "tdg": TdgGate, "swap": SwapGate, "cx": CXGate,
-        "cy":  CYGate, "cz": CZGate, "csx": CSXGate, "ccx": CCXGate, "ccz": CCZGate, 
-        "cswap": CSwapGate, "ecr":ECRGate, "reset": Reset
-    }
-
-    param_gate_map = {
-        "u1": (U1Gate, 1), "u2": (U2Gate, 2),"u3": (U3Gate, 3), "cu1": (CU1Gate, 1), 
-        "cu3": (CU3Gate, 3), "u": (UGate, 3), "cu": (CUGate, 4), "p": (PhaseGate, 1),
-        "r": (RGate, 2), "rx": (RXGate, 1), "ry": (RYGate, 1), "rz": (RZGate, 1), 
-        "crx": (CRXGate, 1), "cry": (CRYGate, 1), "crz": (CRZGate, 1), "rxx": (RXXGate, 1), 
-        "ryy": (RYYGate, 1),"rzz": (RZZGate, 1),"rzx": (RZXGate, 1), "cp": (CPhaseGate, 1)
-    }
+def _get_gate(name: str):
 
     gate_name = name.lower()
 
     # parametric gate
-    if gate_name in no_param_gate_map:
-        return no_param_gate_map[gate_name]()
+    if gate_name in _NO_PARAM_GATE_MAP:
+        return _NO_PARAM_GATE_MAP[gate_name]()
     
-    elif gate_name in param_gate_map:
-        gate_cls, num_params = param_gate_map[gate_name]
+    elif gate_name in _PARAM_GATE_MAP:
+        gate_cls, num_params = _PARAM_GATE_MAP[gate_name]
         params = [Parameter(f"theta_{i}") for i in range(num_params)]
 
         return gate_cls(*params)
@@ -19,17 +19,20 @@
         >>> gather([qjob_1, qjob_2])
         [<cunqa.result.Result object at XXXXXXXX>, <cunqa.result.Result object at XXXXXXXX>]
     """
+from __future__ import annotations
 
 import json
-from typing import  Optional, Any, Union
+from typing import  Optional, Any, Union, TYPE_CHECKING
 
 from cunqa.logger import logger
 from cunqa.result import Result
 from cunqa.qclient import QClient, FutureWrapper
-from sympy import Symbol
 from cunqa.circuit.parameter import encoder, Param
 from cunqa.real_qpus.qmioclient import QMIOClient, QMIOFuture
 
+if TYPE_CHECKING:
+    from sympy import Symbol
+
 class QJob:
     """
     Class to handle jobs sent to vQPUs. A :py:class:`QJob` object is created as the output 
@@ -256,11 +259,12 @@ class QJob:
         if isinstance(param_values, dict):
             for param in self._params:
                 # I filter the free parameters that are employed in the symbolic expression 
-                values_i = {k.name: param_values.get(k.name) 
-                            for k in param.variables 
-                            if param_values.get(k.name) is not None}
+                variables = param.variables
+                values_i = {k.name: value 
+                            for k in variables 
+                            if (value := param_values.get(k.name)) is not None}
 
-                if len(values_i) != len(param.variables):
+                if len(values_i) != len(variables):
                     if param.value is None:
                         raise ValueError("Cannot update the param value and it is None, cannot execute.")
                     else:
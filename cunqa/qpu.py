@@ -13,14 +13,14 @@ into two subgroups:
   creating the :py:class:`~cunqa.qpu.QPU` objects corresponding to the vQPUs and for sending
   quantum tasks to the specified vQPUs, respectively.
 """
+from __future__ import annotations
 
 import os
 import time
 import json
 import subprocess
 import re
-from typing import Union, Any, Optional, TypedDict
-from sympy import Symbol
+from typing import Union, Any, Optional, TypedDict, TYPE_CHECKING
 
 from collections import Counter
 
@@ -31,6 +31,9 @@ from cunqa.qjob import QJob
 from cunqa.logger import logger
 from cunqa.constants import QPUS_FILEPATH, REMOTE_GATES
 
+if TYPE_CHECKING:
+    from sympy import Symbol
+
 class Backend(TypedDict):
     """
     .. autoattribute:: basis_gates
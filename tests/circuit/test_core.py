@@ -12,6 +12,7 @@ else:
 import pytest
 import numpy as np
 import sympy
+import weakref
 from unittest.mock import Mock, patch
 from cunqa.circuit.parameter import Param
 
@@ -183,6 +184,35 @@ def test_add_instruction_param_deep_copy():
     assert str(circuit.params[0].expr) == str(param.expr)
 
 
+def test_add_instruction_param_objects_mixed_with_numbers():
+    """Test that every parameter is kept when Param objects are mixed with numbers"""
+    circuit = CunqaCircuit(1)
+    theta = Param(sympy.Symbol('theta'))
+    phi = Param(sympy.Symbol('phi'))
+    instr = {"name": "u", "params": [theta, 1.5, phi]}
+
+    circuit.add_instructions(instr)
+
+    new_params = circuit.instructions[0]["params"]
+    assert len(new_params) == 3
+    assert new_params[0] is circuit.params[0] and new_params[2] is circuit.params[1]
+    assert new_params[1] == 1.5
+    assert [str(p.expr) for p in circuit.params] == ["theta", "phi"]
+
+
+def test_add_instruction_with_param_object_does_not_alias_input():
+    """Test that the stored instruction does not share containers with the input one"""
+    circuit = CunqaCircuit(1)
+    param = Param(sympy.Symbol('theta'))
+    instr = {"name": "rx", "qubits": [0], "params": [param]}
+
+    circuit.add_instructions(instr)
+    circuit.instructions[0]["qubits"].append(1)
+
+    assert instr["qubits"] == [0]
+    assert instr["params"][0] is param
+
+
 def test_add_instruction_complex_expression():
     """Test adding instruction with complex symbolic expression"""
     circuit = CunqaCircuit(1)
@@ -206,6 +236,19 @@ def test_init_generates_id_and_adds_default_q_register(monkeypatch):
     assert circuit.quantum_regs["q0"] == [0, 1]
 
 
+def test_init_interns_id():
+    import sys
+
+    circuit = CunqaCircuit(1, id="".join(["my", "_", "circuit"]))
+
+    assert circuit.id is sys.intern("my_circuit")
+
+
+def test_circuit_supports_weak_references():
+    circuit = CunqaCircuit(1)
+    assert weakref.ref(circuit)() is circuit
+
+
 def test_init_with_num_clbits_adds_default_classical_register(monkeypatch):
     monkeypatch.setattr(circuit_mod, "generate_id", lambda: "ID")
 
@@ -0,0 +1,46 @@
+#circuit/test_helpers.py
+import os, sys
+
+IN_GITHUB_ACTIONS = os.getenv("GITHUB_ACTIONS") == "true"
+
+if IN_GITHUB_ACTIONS:
+    sys.path.insert(0, os.getcwd())
+else:
+    HOME = os.getenv("HOME")
+    sys.path.insert(0, HOME)
+
+from cunqa.circuit.helpers import copy_instruction
+
+
+def test_copy_instruction_copies_lists_and_nested_instructions():
+    instr = {
+        "name": "cif",
+        "clbits": [0],
+        "condition": 1,
+        "instructions": [{"name": "rx", "qubits": [1], "params": [0.5]}],
+    }
+
+    new = copy_instruction(instr)
+    new["clbits"].append(3)
+    new["instructions"][0]["qubits"].append(2)
+
+    assert new is not instr
+    assert instr["clbits"] == [0]
+    assert instr["instructions"][0]["qubits"] == [1]
+    assert new["condition"] == 1
+
+
+def test_copy_instruction_shares_param_objects():
+    param = object()
+    new = copy_instruction({"name": "rx", "qubits": [0], "params": [param]})
+    assert new["params"][0] is param
+
+
+def test_copy_instruction_copies_nested_lists():
+    matrix = [[[1, 0], [0, 0]], [[0, 0], [1, 0]]]
+    instr = {"name": "unitary", "qubits": [0], "params": [matrix]}
+
+    new = copy_instruction(instr)
+    new["params"][0][0][0][0] = 5
+
+    assert matrix == [[[1, 0], [0, 0]], [[0, 0], [1, 0]]]
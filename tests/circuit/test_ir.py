@@ -196,3 +196,99 @@ def test_to_ir_quantumcircuit_if_else_without_else_is_supported(monkeypatch):
     # Your code should mark it as dynamic and inline the subcircuit instructions.
     assert ir["is_dynamic"] is True
     assert ir["instructions"][0]["instructions"][0]["name"] == "x"
+
+
+def test_to_ir_quantumcircuit_repeated_conversions_are_independent(monkeypatch):
+    ids = iter(["GID1", "GID2"])
+    monkeypatch.setattr(mod_ir, "generate_id", lambda: next(ids))
+
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+
+    first = mod_ir.to_ir(qc)
+    first["instructions"][0]["qubits"].append(999)
+    second = mod_ir.to_ir(qc)
+
+    assert first["id"] == "QuantumCircuit_GID1"
+    assert second["id"] == "QuantumCircuit_GID2"
+    assert second["instructions"][0] == {"name": "h", "qubits": [0], "params": []}
+
+
+def test_to_ir_quantumcircuit_reflects_changes_between_conversions(monkeypatch):
+    from qiskit.circuit import Parameter
+
+    monkeypatch.setattr(mod_ir, "generate_id", lambda: "GID")
+
+    theta = Parameter("theta")
+    qc = QuantumCircuit(1)
+    qc.rx(theta, 0)
+    assert mod_ir.to_ir(qc)["instructions"][0]["params"] == ["theta"]
+
+    qc.assign_parameters({theta: 0.5}, inplace=True)
+    assert mod_ir.to_ir(qc)["instructions"][0]["params"] == [0.5]
+
+    qc.x(0)
+    assert [i["name"] for i in mod_ir.to_ir(qc)["instructions"]] == ["rx", "x"]
+
+
+def test_to_ir_quantumcircuit_reflects_added_registers(monkeypatch):
+    from qiskit import QuantumRegister
+
+    monkeypatch.setattr(mod_ir, "generate_id", lambda: "GID")
+
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    assert mod_ir.to_ir(qc)["num_qubits"] == 2
+
+    qc.add_register(QuantumRegister(3, "r"))
+    ir = mod_ir.to_ir(qc)
+
+    assert ir["num_qubits"] == 5
+    assert ir["quantum_registers"] == {"q": [0, 1], "r": [2, 3, 4]}
+
+
+def test_to_ir_quantumcircuit_reflects_substituted_instructions_and_parameters(monkeypatch):
+    from qiskit.circuit import CircuitInstruction, Parameter
+    from qiskit.circuit.library import ZGate
+
+    monkeypatch.setattr(mod_ir, "generate_id", lambda: "GID")
+
+    qc = QuantumCircuit(1)
+    qc.x(0)
+    assert mod_ir.to_ir(qc)["instructions"][0]["name"] == "x"
+
+    qc.data[0] = CircuitInstruction(ZGate(), qc.qubits)
+    assert mod_ir.to_ir(qc)["instructions"][0]["name"] == "z"
+
+    t, s = Parameter("t"), Parameter("s")
+    qc = QuantumCircuit(1)
+    qc.rx(t, 0)
+    assert mod_ir.to_ir(qc)["instructions"][0]["params"] == ["t"]
+
+    qc.assign_parameters({t: 2 * s}, inplace=True)
+    (param,) = mod_ir.to_ir(qc)["instructions"][0]["params"]
+    assert param == 2 * s
+
+
+def test_to_ir_quantumcircuit_if_else_maps_body_bits_without_modifying_it(monkeypatch):
+    from qiskit import QuantumRegister, ClassicalRegister
+
+    monkeypatch.setattr(mod_ir, "generate_id", lambda: "GID")
+
+    qc = QuantumCircuit(QuantumRegister(1, "a"), QuantumRegister(2, "b"), ClassicalRegister(2, "c"))
+    true_body = QuantumCircuit(1, 1)
+    true_body.x(0)
+    true_body.measure(0, 0)
+    qc.if_else((qc.clbits[1], 1), true_body, None, [2], [1])
+
+    ir = mod_ir.to_ir(qc)
+
+    assert ir["is_dynamic"] is True
+    assert ir["instructions"][0]["clbits"] == [1]
+    assert ir["instructions"][0]["instructions"] == [
+        {"name": "x", "qubits": [2], "params": []},
+        {"name": "measure", "qubits": [2], "clbits": [1]},
+    ]
+    assert [r.name for r in true_body.qregs] == ["q"]
@@ -144,6 +144,40 @@ def test_hsplit_raises_on_three_qubit_gate():
         part_mod.hsplit(c, [1, 2])
 
 
+def test_hsplit_remaps_measured_clbits_per_section():
+    c = FakeCircuit(num_qubits=3, num_clbits=3, id="A")
+    c.add_instructions({"name": "measure", "qubits": [2], "clbits": [2]})
+    c.add_instructions({"name": "measure", "qubits": [0], "clbits": [1]})
+    c.add_instructions({"name": "x", "qubits": [1]})
+    c.add_instructions({"name": "measure", "qubits": [1], "clbits": [0]})
+
+    subs = part_mod.hsplit(c, [2, 1])
+
+    assert subs[0].num_clbits == 2
+    assert subs[0].instructions == [
+        {"name": "measure", "qubits": [0], "clbits": [1]},
+        {"name": "x", "qubits": [1]},
+        {"name": "measure", "qubits": [1], "clbits": [0]},
+    ]
+    assert subs[1].num_clbits == 1
+    assert subs[1].instructions == [{"name": "measure", "qubits": [0], "clbits": [0]}]
+
+
+def test_hsplit_does_not_modify_input_circuit():
+    c = FakeCircuit(num_qubits=2, num_clbits=1, id="A")
+    c.add_instructions({"name": "h", "qubits": [1]})
+    c.add_instructions({"name": "cx", "qubits": [0, 1]})
+    c.add_instructions({"name": "measure", "qubits": [1], "clbits": [0]})
+
+    part_mod.hsplit(c, [1, 1])
+
+    assert c.instructions == [
+        {"name": "h", "qubits": [1]},
+        {"name": "cx", "qubits": [0, 1]},
+        {"name": "measure", "qubits": [1], "clbits": [0]},
+    ]
+
+
 # -------------------------
 # union tests
 # -------------------------
@@ -174,6 +208,99 @@ def test_union_reindexes_qubits_and_clbits():
     ]
 
 
+def test_union_without_communications_concatenates_displaced_circuits():
+    c1 = FakeCircuit(num_qubits=2, num_clbits=0, id="A")
+    c2 = FakeCircuit(num_qubits=1, num_clbits=0, id="B")
+
+    c1.add_instructions({"name": "h", "qubits": [0]})
+    c1.add_instructions({"name": "cx", "qubits": [0, 1]})
+    c2.add_instructions({"name": "x", "qubits": [0]})
+
+    out = part_mod.union([c1, c2])
+
+    assert out.is_dynamic is False
+    assert out.instructions == [
+        {"name": "h", "qubits": [0]},
+        {"name": "cx", "qubits": [0, 1]},
+        {"name": "x", "qubits": [2]},
+    ]
+
+
+def test_union_keeps_round_robin_order_for_external_communications():
+    cA = FakeCircuit(num_qubits=1, num_clbits=1, id="A")
+    cB = FakeCircuit(num_qubits=1, num_clbits=1, id="B")
+
+    cA.add_instructions({"name": "x", "qubits": [0]})
+    cA.add_instructions({"name": "x", "qubits": [0]})
+    cA.add_instructions({"name": "recv", "clbits": [0], "circuits": ["C"]})
+    cB.add_instructions({"name": "send", "clbits": [0], "circuits": ["C"]})
+
+    out = part_mod.union([cA, cB])
+
+    assert out.instructions == [
+        {"name": "x", "qubits": [0]},
+        {"name": "send", "clbits": [1], "circuits": ["C"]},
+        {"name": "x", "qubits": [0]},
+        {"name": "recv", "clbits": [0], "circuits": ["C"]},
+    ]
+
+
+def test_union_reindexes_cif_block_in_place():
+    c1 = FakeCircuit(num_qubits=1, num_clbits=1, id="A")
+    c2 = FakeCircuit(num_qubits=2, num_clbits=1, id="B")
+
+    c1.add_instructions({"name": "h", "qubits": [0]})
+    c2.add_instructions({"name": "measure", "qubits": [0], "clbits": [0]})
+    c2.add_instructions(
+        {
+            "name": "cif",
+            "clbits": [0],
+            "instructions": [{"name": "x", "qubits": [1]}],
+        }
+    )
+
+    out = part_mod.union([c1, c2])
+
+    assert out.instructions == [
+        {"name": "h", "qubits": [0]},
+        {"name": "measure", "qubits": [1], "clbits": [1]},
+        {"name": "cif", "clbits": [1], "instructions": [{"name": "x", "qubits": [2]}]},
+    ]
+
+
+def test_union_does_not_modify_input_circuits():
+    c1 = FakeCircuit(num_qubits=1, num_clbits=1, id="A")
+    c2 = FakeCircuit(num_qubits=1, num_clbits=1, id="B")
+
+    c1.add_instructions({"name": "h", "qubits": [0]})
+    c2.add_instructions({"name": "rx", "qubits": [0], "params": [0.5]})
+    c2.add_instructions({"name": "measure", "qubits": [0], "clbits": [0]})
+    original = copy.deepcopy(c2.instructions)
+
+    out = part_mod.union([c1, c2])
+    out.instructions[1]["params"].append(1.0)
+
+    assert c2.instructions == original
+
+
+def test_union_does_not_share_nested_containers_with_input_circuits():
+    c1 = FakeCircuit(num_qubits=1, num_clbits=1, id="A")
+    c2 = FakeCircuit(num_qubits=1, num_clbits=1, id="B")
+
+    c1.add_instructions({"name": "send", "clbits": [0], "circuits": ["C"]})
+    c2.add_instructions({"name": "unitary", "qubits": [0], 
+                         "params": [[[[1, 0], [0, 0]], [[0, 0], [1, 0]]]]})
+    original_1 = copy.deepcopy(c1.instructions)
+    original_2 = copy.deepcopy(c2.instructions)
+
+    out = part_mod.union([c1, c2])
+    out.instructions[0]["circuits"].append("D")
+    out.instructions[1]["params"][0][0][0][0] = 5
+
+    assert c1.instructions == original_1
+    assert c2.instructions == original_2
+
+
 def test_union_send_recv():
     cA = FakeCircuit(num_qubits=1, num_clbits=1, id="A")
     cB = FakeCircuit(num_qubits=1, num_clbits=1, id="B")
@@ -276,3 +403,17 @@ def test_add_concatenates_instructions_and_sets_shape_and_id():
         {"name": "x", "qubits": [0]},
         {"name": "measure", "qubits": [1], "clbits": [2]},
     ]
+
+
+def test_add_does_not_alias_input_instructions():
+    cA = FakeCircuit(num_qubits=1, num_clbits=0, id="A")
+    cB = FakeCircuit(num_qubits=1, num_clbits=0, id="B")
+
+    cA.add_instructions({"name": "rx", "qubits": [0], "params": [0.5]})
+    cB.add_instructions({"name": "x", "qubits": [0]})
+
+    out = part_mod.add([cA, cB])
+    out.instructions[0]["qubits"][0] = 7
+    out.instructions[0]["params"][0] = 1.0
+
+    assert cA.instructions == [{"name": "rx", "qubits": [0], "params": [0.5]}]
@@ -171,6 +171,20 @@ class TestCunqaBackend:
         # Expecting a list of tuples representing the coupling map
         assert backend.coupling_map_list == [(0, 1)]
 
+    def test_malformed_gate_properties_raise_runtime_error(self, sample_noise_properties_json):
+        """Test that missing gate properties raise an exception instead of exiting."""
+        test_noise_properties = copy.deepcopy(sample_noise_properties_json)
+        del test_noise_properties["Q1Gates"]["q[0]"]["x"]["Gate duration (s)"]
+
+        with pytest.raises(RuntimeError, match="gate x"):
+            CunqaBackend(noise_properties_json=test_noise_properties)
+
+        test_noise_properties = copy.deepcopy(sample_noise_properties_json)
+        del test_noise_properties["Q2Gates(RB)"]["0-1"]["cx"]["Duration (s)"]
+
+        with pytest.raises(RuntimeError, match="gate cx"):
+            CunqaBackend(noise_properties_json=test_noise_properties)
+
     def test_noise_properties_parsing_with_warnings(self, sample_noise_properties_json, caplog):
         """Test parsing noise properties with potential warning scenarios."""
         # Create a deep copy to avoid modifying the original fixture
@@ -185,6 +199,10 @@ class TestCunqaBackend:
             'Fidelity(RB)': 0.95
         }
 
-        with pytest.raises(RuntimeError):
-           CunqaBackend(noise_properties_json=test_noise_properties)
+        backend = CunqaBackend(noise_properties_json=test_noise_properties)
+
+        assert "unsupported_gate" not in test_noise_properties['Q1Gates']['q[0]']
+        assert "unsupported_gate" not in test_noise_properties['Q2Gates(RB)']['0-1']
+        assert "unsupported_gate" not in backend.target.operation_names
+        assert "not supported by Aer Simulator" in caplog.text
         
\ No newline at end of file